@@ -0,0 +1,42 @@
+"""
+Salary Analytics
+Aggregation helpers for the Employee Management System.
+Numba is optional: when installed, the helpers are JIT-compiled to native code;
+otherwise they run as plain Python on the same inputs.
+"""
+
+import math
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        return lambda func: func
+
+
+@njit(cache=True)
+def salary_stats(salaries):
+    """
+    Return (mean, std, min, max) of a non-empty float64 salary array.
+    Accepts any float64 buffer (NumPy array or array('d')); std is the population deviation.
+    """
+    n = len(salaries)
+    total = 0.0
+    lowest = salaries[0]
+    highest = salaries[0]
+    for i in range(n):
+        value = salaries[i]
+        total += value
+        if value < lowest:
+            lowest = value
+        if value > highest:
+            highest = value
+
+    mean = total / n
+    sq_diff = 0.0
+    for i in range(n):
+        diff = salaries[i] - mean
+        sq_diff += diff * diff
+
+    return mean, math.sqrt(sq_diff / n), lowest, highest
@@ -13,33 +13,73 @@ Date: January 2026
 employee_management.py
 │
 ├── 📦 Imports
+│   ├── array (array)
 │   ├── csv
+│   ├── functools
+│   ├── gc
+│   ├── os
+│   ├── queue
 │   ├── re
-│   └── typing (Any, Dict, List, Optional, Tuple)
+│   ├── sys
+│   ├── threading
+│   ├── weakref
+│   ├── collections (Counter)
+│   ├── operator (attrgetter)
+│   ├── typing (Any, Container, Dict, Iterable, List, Optional, Tuple)
+│   ├── sortedcontainers (SortedDict, optional)
+│   ├── _fastload (compiled Cython row loader, optional)
+│   └── analytics (salary_stats, Numba-accelerated when available)
+│
+├── 🔤 Module Constants
+│   └── _EMAIL_RE (precompiled email regex)
 │
 ├── ✅ Validation Functions (Pure Functions)
+│   ├── _email_format_ok(email) → bool (lru_cache)
 │   ├── validate_email(email) → (bool, error)
 │   ├── validate_salary(salary) → (bool, value, error)
 │   ├── validate_required_field(value, field_name) → (bool, error)
 │   └── validate_employee_id(emp_id, existing_ids) → (bool, error)
 │
+├── 👤 Class: Employee (__slots__ record)
+│   └── ID, Name, Position, Salary, Email, SalaryStr (cached CSV text of Salary)
+│
 ├── 🏢 Class: EmployeeManager
 │   │
 │   ├── 📊 Class Constants
-│   │   └── FIELDNAMES = ['ID', 'Name', 'Position', 'Salary', 'Email']
+│   │   ├── FIELDNAMES = ['ID', 'Name', 'Position', 'Salary', 'Email']
+│   │   ├── _ROW_EXTRACTOR (Employee → CSV row tuple, using cached SalaryStr)
+│   │   ├── _STOP (writer thread shutdown sentinel)
+│   │   └── _VIEW_CHUNK_ROWS (rows buffered per stdout write in view)
 │   │
 │   ├── 🔨 Constructor
 │   │   └── __init__(filename="employees.csv")
 │   │       ├── self.filename
-│   │       ├── self._employees (Dict)
-│   │       └── calls _load_from_csv()
+│   │       ├── self._employees (SortedDict or Dict of ID → Employee)
+│   │       ├── self._email_index (Counter of registered emails)
+│   │       ├── calls _load_from_csv()
+│   │       └── starts background writer thread (stopped by close() or at exit)
 │   │
 │   ├── 💾 CSV File Operations (Private Methods)
+│   │   ├── _column_positions(header) → Tuple[int, ...]
 │   │   ├── _load_from_csv() → None
-│   │   ├── _save_to_csv() → bool
+│   │   ├── _save_to_csv(employees) → bool
+│   │   ├── _append_row_to_csv(row) → bool
 │   │   └── _create_csv_file() → bool
 │   │
+│   ├── 🧵 Background Writer
+│   │   ├── _queue_save() → None (writes synchronously once closed)
+│   │   ├── _queue_append(row) → None (writes synchronously once closed)
+│   │   ├── _writer_loop() → None
+│   │   ├── _stop_writer(write_queue, writer_thread) → None
+│   │   ├── flush() → bool (False if any write since the last flush failed)
+│   │   ├── close() → None (also run at interpreter exit)
+│   │   └── __enter__() / __exit__() (context manager)
+│   │
 │   ├── 🛠️ Helper Methods (Private)
+│   │   ├── _index_email(email) / _unindex_email(email) → None
+│   │   ├── _new_store() → Dict
+│   │   ├── _sorted_employees() → Iterable of records
+│   │   ├── _salary_column() → array('d')
 │   │   ├── _prompt_until_valid(prompt, validator) → Any
 │   │   └── _get_optional_input(prompt, current_value, validator) → Any
 │   │
@@ -47,35 +87,48 @@ employee_management.py
 │   │   ├── 1️⃣ add_employee() → None
 │   │   │   ├── Prompts: ID, Name, Position, Salary, Email
 │   │   │   ├── Validates all inputs
-│   │   │   ├── Stores in _employees dict
-│   │   │   └── Saves to CSV
+│   │   │   ├── Stores Employee in _employees
+│   │   │   └── Appends new row to CSV, reports success after flush()
 │   │   │
 │   │   ├── 2️⃣ view_all_employees() → None
-│   │   │   ├── Displays all employees in table format
+│   │   │   ├── Displays all employees in table format (buffered writes)
 │   │   │   └── Shows sorted by ID
 │   │   │
 │   │   ├── 3️⃣ update_employee() → None
 │   │   │   ├── Search by ID
 │   │   │   ├── Show current details
 │   │   │   ├── Update fields (optional)
-│   │   │   └── Save to CSV
+│   │   │   └── Saves CSV, reports success after flush()
 │   │   │
 │   │   ├── 4️⃣ delete_employee() → None
 │   │   │   ├── Search by ID
 │   │   │   ├── Confirmation prompt
 │   │   │   ├── Delete from dict
-│   │   │   └── Save to CSV
+│   │   │   └── Saves CSV, reports success after flush()
+│   │   │
+│   │   ├── 5️⃣ search_employee() → None
+│   │   │   ├── Search by ID
+│   │   │   └── Display details or "not found"
+│   │   │
+│   │   └── 6️⃣ salary_statistics() → None
+│   │       └── Displays count, average, std dev, min and max salary
+│   │
+│   ├── 📥 Bulk Operations (Public Methods)
+│   │   ├── 7️⃣ import_employees() → None
+│   │   │   ├── Prompts for a CSV path
+│   │   │   └── Calls bulk_import() and reports skipped rows
 │   │   │
-│   │   └── 5️⃣ search_employee() → None
-│   │       ├── Search by ID
-│   │       └── Display details or "not found"
+│   │   └── bulk_import(path) → (imported, errors)
+│   │       ├── Streams source CSV with csv.reader
+│   │       ├── Validates each row, skips duplicates
+│   │       └── Saves the CSV once and waits for the write
 │   │
 │   └── 🚀 Main Method
 │       └── run() → None
-│           ├── Display menu (1-6)
+│           ├── Display menu (1-8)
 │           ├── Get user choice
 │           ├── Call corresponding method
-│           └── Loop until exit (6)
+│           └── Loop until exit (8), then close()
 │
 └── 🎯 Main Execution
     └── if __name__ == "__main__":
@@ -91,26 +144,61 @@ employee_management.py
 """
 
 import csv
+import functools
+import gc
+import os
+import queue
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import sys
+import threading
+import weakref
+from array import array
+from collections import Counter
+from operator import attrgetter
+from typing import Any, Container, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from sortedcontainers import SortedDict
+except ImportError:  # optional: fall back to a plain dict sorted at display time
+    SortedDict = None
+
+_FASTLOAD_VERSION = 3
+
+try:
+    import _fastload
+except ImportError:  # optional: build with `cythonize -i _fastload.pyx`
+    _fastload = None
+
+if getattr(_fastload, 'LOAD_ROWS_VERSION', None) != _FASTLOAD_VERSION:
+    _fastload = None  # missing or stale build; rebuild with `cythonize -i _fastload.pyx`
+
+from analytics import salary_stats
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
 
 # ==================== Validation Functions ====================
 
+@functools.lru_cache(maxsize=256)
+def _email_format_ok(email: str) -> bool:
+    """Check a stripped email against the email regex, memoizing repeated inputs."""
+    return _EMAIL_RE.fullmatch(email) is not None
+
+
 def validate_email(email: str) -> Tuple[bool, Optional[str]]:
-    """Validate email format using regex."""
-    if not email or not email.strip():
+    """Validate email format using regex. Expects input already stripped of whitespace."""
+    if not email:
         return False, "Email cannot be empty"
     
-    if not re.fullmatch(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email.strip()):
+    if not _email_format_ok(email):
         return False, "Invalid email format"
     
     return True, None
 
 
 def validate_salary(salary: str) -> Tuple[bool, Optional[float], Optional[str]]:
-    """Validate that salary is a positive number."""
-    if not salary or not salary.strip():
+    """Validate that salary is a positive number. Expects input already stripped of whitespace."""
+    if not salary:
         return False, None, "Salary cannot be empty"
     
     try:
@@ -123,33 +211,53 @@ def validate_salary(salary: str) -> Tuple[bool, Optional[float], Optional[str]]:
 
 
 def validate_required_field(value: str, field_name: str) -> Tuple[bool, Optional[str]]:
-    """Validate that a required field is not empty."""
-    if not value or not value.strip():
+    """Validate that a required field is not empty. Expects input already stripped of whitespace."""
+    if not value:
         return False, f"{field_name} cannot be empty"
     return True, None
 
 
-def validate_employee_id(emp_id: str, existing_ids: List[str]) -> Tuple[bool, Optional[str]]:
-    """Validate employee ID format and uniqueness."""
-    if not emp_id or not emp_id.strip():
+def validate_employee_id(emp_id: str, existing_ids: Container[str]) -> Tuple[bool, Optional[str]]:
+    """Validate employee ID format and uniqueness. Expects input already stripped of whitespace."""
+    if not emp_id:
         return False, "Employee ID cannot be empty"
     
-    if emp_id.strip() in existing_ids:
+    if emp_id in existing_ids:
         return False, f"Employee with ID '{emp_id}' already exists"
     
     return True, None
 
 
-def validate_unique_email(email: str, existing_emails: List[str]) -> Tuple[bool, Optional[str]]:
-    """Validate email uniqueness."""
-    is_valid, error = validate_email(email)
-    if not is_valid:
-        return False, error
+def validate_unique_email(email: str, existing_emails: Container[str]) -> Tuple[bool, Optional[str]]:
+    """Validate email uniqueness. Expects input already stripped of whitespace."""
+    if not email:
+        return False, "Email cannot be empty"
     
-    if email.strip() in existing_emails:
+    # Hash lookup before the regex: a duplicate is rejected without running it
+    if email in existing_emails:
         return False, f"Email '{email}' is already registered to another employee"
     
-    return True, None
+    return validate_email(email)
+
+
+# ==================== Employee Record ====================
+
+class Employee:
+    """
+    A single employee record.
+    Uses __slots__ instead of a per-record dict; SalaryStr caches the CSV text of Salary.
+    """
+    
+    __slots__ = ('ID', 'Name', 'Position', 'Salary', 'Email', 'SalaryStr')
+    
+    def __init__(self, ID: str, Name: str, Position: str, Salary: float, Email: str,
+                 SalaryStr: Optional[str] = None):
+        self.ID = ID
+        self.Name = Name
+        self.Position = Position
+        self.Salary = Salary
+        self.Email = Email
+        self.SalaryStr = SalaryStr if SalaryStr is not None else format(Salary, '.2f')
 
 
 # ==================== EmployeeManager Class ====================
@@ -157,51 +265,137 @@ def validate_unique_email(email: str, existing_emails: List[str]) -> Tuple[bool,
 class EmployeeManager:
     """
     Manages employee records with CRUD operations.
-    Handles data storage (dict), CSV file operations, input validation, and CLI interface.
+    Handles data storage (dict of Employee records), CSV file operations, input validation, and CLI interface.
     """
     
     FIELDNAMES: List[str] = ['ID', 'Name', 'Position', 'Salary', 'Email']
+    _ROW_EXTRACTOR = attrgetter('ID', 'Name', 'Position', 'SalaryStr', 'Email')
+    _STOP = object()
+    _VIEW_CHUNK_ROWS: int = 1000
     
     def __init__(self, filename: str = "employees.csv"):
         """Initialize the EmployeeManager."""
         self.filename = filename
-        self._employees: Dict[str, Dict[str, Any]] = {}
+        self._employees: Dict[str, Employee] = self._new_store()
+        self._email_index: Counter[str] = Counter()
         self._load_from_csv()
+        
+        self._write_queue: queue.Queue = queue.Queue()
+        self._write_failed = False
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+        # Flush pending writes at interpreter exit even if close() is never called
+        self._writer_finalizer = weakref.finalize(
+            self, self._stop_writer, self._write_queue, self._writer_thread
+        )
+    
+    def __enter__(self) -> "EmployeeManager":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     # ==================== CSV File Operations ====================
     
+    def _column_positions(self, header: List[str]) -> Tuple[int, ...]:
+        """Return the index of each FIELDNAMES column within a CSV header row."""
+        missing = [name for name in self.FIELDNAMES if name not in header]
+        if missing:
+            raise ValueError(f"Missing column(s): {', '.join(missing)}")
+        return tuple(header.index(name) for name in self.FIELDNAMES)
+    
     def _load_from_csv(self) -> None:
         """Load employee data from CSV file into dictionary."""
-        self._employees = {}
+        self._employees = self._new_store()
+        self._email_index = Counter()
         
         try:
             with open(self.filename, 'r', newline='') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if not row.get('ID'):
-                        continue
-                    
-                    self._employees[row['ID']] = {
-                        'ID': row['ID'],
-                        'Name': row['Name'],
-                        'Position': row['Position'],
-                        'Salary': float(row['Salary']),
-                        'Email': row['Email']
-                    }
+                reader = csv.reader(file)
+                header = next(reader, None)
+                if not header:
+                    return
+                
+                # Resolve column positions once instead of per-row dict lookups
+                id_i, name_i, pos_i, salary_i, email_i = self._column_positions(header)
+                
+                # Pause cyclic GC while allocating many small row dicts
+                gc_was_enabled = gc.isenabled()
+                gc.disable()
+                try:
+                    if _fastload is not None:
+                        _fastload.load_rows(reader, id_i, name_i, pos_i, salary_i, email_i,
+                                            self._employees, self._email_index, Employee)
+                    else:
+                        for row in reader:
+                            if not row or not row[id_i]:
+                                continue
+                            
+                            # A later row with the same ID replaces the earlier one
+                            previous = self._employees.get(row[id_i])
+                            if previous is not None:
+                                self._unindex_email(previous.Email)
+                            
+                            self._employees[row[id_i]] = Employee(
+                                row[id_i],
+                                row[name_i],
+                                row[pos_i],
+                                float(row[salary_i]),
+                                row[email_i],
+                                SalaryStr=row[salary_i]
+                            )
+                            self._index_email(row[email_i])
+                finally:
+                    if gc_was_enabled:
+                        gc.enable()
         except FileNotFoundError:
             self._create_csv_file()
         except Exception as e:
             print(f"Error loading data: {e}")
     
-    def _save_to_csv(self) -> bool:
-        """Save all employee data from dictionary to CSV file."""
+    def _save_to_csv(self, employees: Dict[str, Employee]) -> bool:
+        """Save a snapshot of employee data to CSV file, replacing it atomically."""
+        tmp_filename = self.filename + '.tmp'
         try:
-            with open(self.filename, 'w', newline='') as file:
-                writer = csv.DictWriter(file, fieldnames=self.FIELDNAMES)
-                writer.writeheader()
-                # Sort employees by ID before writing to CSV
-                for emp_id in sorted(self._employees.keys()):
-                    writer.writerow(self._employees[emp_id])
+            with open(tmp_filename, 'w', newline='', buffering=1 << 20) as file:
+                writer = csv.writer(file)
+                writer.writerow(self.FIELDNAMES)
+                writer.writerows(map(self._ROW_EXTRACTOR, employees.values()))
+                # Make the data durable before the rename can expose it
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_filename, self.filename)
+            return True
+        except Exception as e:
+            print(f"Error saving data: {e}")
+            try:
+                os.remove(tmp_filename)
+            except OSError:
+                pass
+            return False
+    
+    def _append_row_to_csv(self, employee: Employee) -> bool:
+        """Append a single employee row to the CSV file without rewriting it."""
+        try:
+            if not os.path.exists(self.filename) or os.path.getsize(self.filename) == 0:
+                if not self._create_csv_file():
+                    return False
+            
+            # The loader accepts any column order, so match the file's own header
+            with open(self.filename, 'r', newline='') as file:
+                header = next(csv.reader(file), None) or self.FIELDNAMES
+            self._column_positions(header)
+            values = dict(zip(self.FIELDNAMES, self._ROW_EXTRACTOR(employee)))
+            
+            with open(self.filename, 'rb') as file:
+                file.seek(-1, os.SEEK_END)
+                needs_newline = file.read(1) not in (b'\n', b'\r')
+            
+            with open(self.filename, 'a', newline='') as file:
+                writer = csv.writer(file)
+                if needs_newline:
+                    file.write(writer.dialect.lineterminator)
+                writer.writerow([values.get(name, '') for name in header])
             return True
         except Exception as e:
             print(f"Error saving data: {e}")
@@ -217,8 +411,104 @@ class EmployeeManager:
         except Exception:
             return False
     
+    # ==================== Background Writer ====================
+    
+    def _queue_save(self) -> None:
+        """Queue a full CSV rewrite of the current employee data."""
+        # Records are replaced rather than mutated, so a shallow copy is a stable snapshot
+        if self._writer_finalizer.alive:
+            self._write_queue.put(('save', dict(self._employees)))
+        else:
+            self._record_write(self._save_to_csv(self._employees))
+    
+    def _queue_append(self, employee: Employee) -> None:
+        """Queue a single employee row to be appended to the CSV file."""
+        if self._writer_finalizer.alive:
+            self._write_queue.put(('append', employee))
+        else:
+            self._record_write(self._append_row_to_csv(employee))
+    
+    def _writer_loop(self) -> None:
+        """Persist queued writes on a background thread, coalescing pending saves."""
+        while True:
+            tasks = [self._write_queue.get()]
+            while True:
+                try:
+                    tasks.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            pending = [task for task in tasks if task is not self._STOP]
+            
+            # The latest full snapshot supersedes every write queued before it
+            start = 0
+            for i, (kind, _) in enumerate(pending):
+                if kind == 'save':
+                    start = i
+            
+            for kind, payload in pending[start:]:
+                if kind == 'save':
+                    self._record_write(self._save_to_csv(payload))
+                else:
+                    self._record_write(self._append_row_to_csv(payload))
+            
+            for _ in tasks:
+                self._write_queue.task_done()
+            
+            if len(pending) != len(tasks):
+                return
+    
+    @classmethod
+    def _stop_writer(cls, write_queue: queue.Queue, writer_thread: threading.Thread) -> None:
+        """Send the shutdown sentinel and wait for the writer to drain the queue."""
+        if writer_thread.is_alive():
+            write_queue.put(cls._STOP)
+            writer_thread.join()
+    
+    def _record_write(self, ok: bool) -> None:
+        """Remember a failed write so the next flush() can report it."""
+        if not ok:
+            self._write_failed = True
+    
+    def flush(self) -> bool:
+        """Block until every queued write is done; return False if any of them failed."""
+        self._write_queue.join()
+        ok = not self._write_failed
+        self._write_failed = False
+        return ok
+    
+    def close(self) -> None:
+        """Flush pending writes and stop the background writer thread; later writes are synchronous."""
+        self._writer_finalizer()
+    
     # ==================== Helper Methods ====================
     
+    def _index_email(self, email: str) -> None:
+        """Record one more employee using this email."""
+        self._email_index[email] += 1
+    
+    def _unindex_email(self, email: str) -> None:
+        """Record one fewer employee using this email, dropping it when none remain."""
+        count = self._email_index[email] - 1
+        if count > 0:
+            self._email_index[email] = count
+        else:
+            del self._email_index[email]
+    
+    def _new_store(self) -> Dict[str, Employee]:
+        """Create the employee store, kept sorted by ID when sortedcontainers is available."""
+        return SortedDict() if SortedDict is not None else {}
+    
+    def _sorted_employees(self) -> Iterable[Employee]:
+        """Return employee records in ID order."""
+        if SortedDict is not None:
+            return self._employees.values()
+        return sorted(self._employees.values(), key=lambda e: e.ID)
+    
+    def _salary_column(self) -> array:
+        """Return all salaries as a contiguous float64 array (unordered; wraps into NumPy without copying)."""
+        return array('d', (e.Salary for e in self._employees.values()))
+    
     def _prompt_until_valid(self, prompt: str, validator) -> Any:
         """Prompt user until valid input is received."""
         while True:
@@ -250,17 +540,17 @@ class EmployeeManager:
         
         emp_id = self._prompt_until_valid(
             "Enter Employee ID: ",
-            lambda v: validate_employee_id(v, list(self._employees.keys()))
+            functools.partial(validate_employee_id, existing_ids=self._employees)
         )
         
         name = self._prompt_until_valid(
             "Enter Name: ",
-            lambda v: validate_required_field(v, "Name")
+            functools.partial(validate_required_field, field_name="Name")
         )
         
         position = self._prompt_until_valid(
             "Enter Position: ",
-            lambda v: validate_required_field(v, "Position")
+            functools.partial(validate_required_field, field_name="Position")
         )
         
         salary = self._prompt_until_valid(
@@ -268,24 +558,19 @@ class EmployeeManager:
             validate_salary
         )
         
-        # Get list of existing emails
-        existing_emails = [emp['Email'] for emp in self._employees.values()]
-        
         email = self._prompt_until_valid(
             "Enter Email: ",
-            lambda v: validate_unique_email(v, existing_emails)
+            functools.partial(validate_unique_email, existing_emails=self._email_index)
         )
         
-        self._employees[emp_id] = {
-            'ID': emp_id,
-            'Name': name,
-            'Position': position,
-            'Salary': salary,
-            'Email': email
-        }
+        self._employees[emp_id] = Employee(emp_id, name, position, salary, email)
+        self._index_email(email)
         
-        self._save_to_csv()
-        print(f"\nEmployee '{name}' added successfully!")
+        self._queue_append(self._employees[emp_id])
+        if self.flush():
+            print(f"\nEmployee '{name}' added successfully!")
+        else:
+            print(f"\nEmployee '{name}' was added but could not be saved to '{self.filename}'!")
         input("\nPress Enter to continue...")
     
     def view_all_employees(self) -> None:
@@ -298,15 +583,22 @@ class EmployeeManager:
             print("\nNo employees found in the system.")
             print("Please add some employees first.")
         else:
-            print(f"\n{'ID':<10} {'Name':<25} {'Position':<20} {'Salary':<15} {'Email':<30}")
-            print("-" * 100)
+            # Buffer lines and write them in chunks rather than one print per row
+            lines = [
+                f"\n{'ID':<10} {'Name':<25} {'Position':<20} {'Salary':<15} {'Email':<30}",
+                "-" * 100,
+            ]
             
-            for employee in self._employees.values():
-                print(f"{employee['ID']:<10} {employee['Name']:<25} {employee['Position']:<20} "
-                      f"${employee['Salary']:>12,.2f}   {employee['Email']:<30}")
+            for employee in self._sorted_employees():
+                lines.append(f"{employee.ID:<10} {employee.Name:<25} {employee.Position:<20} "
+                             f"${employee.Salary:>12,.2f}   {employee.Email:<30}")
+                if len(lines) >= self._VIEW_CHUNK_ROWS:
+                    sys.stdout.write("\n".join(lines) + "\n")
+                    lines.clear()
             
-            print("-" * 100)
-            print(f"Total Employees: {len(self._employees)}")
+            lines.append("-" * 100)
+            lines.append(f"Total Employees: {len(self._employees)}")
+            sys.stdout.write("\n".join(lines) + "\n")
         
         input("\nPress Enter to continue...")
     
@@ -331,49 +623,57 @@ class EmployeeManager:
         employee = self._employees[emp_id]
         
         print(f"\nCurrent Details:")
-        print(f"  Name: {employee['Name']}")
-        print(f"  Position: {employee['Position']}")
-        print(f"  Salary: ${employee['Salary']:,.2f}")
-        print(f"  Email: {employee['Email']}")
+        print(f"  Name: {employee.Name}")
+        print(f"  Position: {employee.Position}")
+        print(f"  Salary: ${employee.Salary:,.2f}")
+        print(f"  Email: {employee.Email}")
         print("\nLeave fields blank to keep current values:")
         
         name = self._get_optional_input(
-            f"Enter new Name (current: {employee['Name']}): ",
-            employee['Name'],
-            lambda v: validate_required_field(v, "Name")
+            f"Enter new Name (current: {employee.Name}): ",
+            employee.Name,
+            functools.partial(validate_required_field, field_name="Name")
         )
         
         position = self._get_optional_input(
-            f"Enter new Position (current: {employee['Position']}): ",
-            employee['Position'],
-            lambda v: validate_required_field(v, "Position")
+            f"Enter new Position (current: {employee.Position}): ",
+            employee.Position,
+            functools.partial(validate_required_field, field_name="Position")
         )
         
         salary = self._get_optional_input(
-            f"Enter new Salary (current: ${employee['Salary']:,.2f}): ",
-            employee['Salary'],
+            f"Enter new Salary (current: ${employee.Salary:,.2f}): ",
+            employee.Salary,
             validate_salary
         )
         
-        # Get list of existing emails excluding current employee's email
-        existing_emails = [emp['Email'] for emp_id_key, emp in self._employees.items() if emp_id_key != emp_id]
-        
-        email = self._get_optional_input(
-            f"Enter new Email (current: {employee['Email']}): ",
-            employee['Email'],
-            lambda v: validate_unique_email(v, existing_emails)
+        # Exclude current employee's email so it can be kept or re-entered;
+        # the finally block restores it if the prompt is interrupted
+        email = employee.Email
+        self._unindex_email(email)
+        try:
+            email = self._get_optional_input(
+                f"Enter new Email (current: {employee.Email}): ",
+                employee.Email,
+                functools.partial(validate_unique_email, existing_emails=self._email_index)
+            )
+        finally:
+            self._index_email(email)
+        
+        self._employees[emp_id] = Employee(
+            emp_id,
+            name,
+            position,
+            salary,
+            email,
+            SalaryStr=employee.SalaryStr if salary == employee.Salary else None
         )
         
-        self._employees[emp_id] = {
-            'ID': emp_id,
-            'Name': name,
-            'Position': position,
-            'Salary': salary,
-            'Email': email
-        }
-        
-        self._save_to_csv()
-        print(f"\nEmployee with ID '{emp_id}' updated successfully!")
+        self._queue_save()
+        if self.flush():
+            print(f"\nEmployee with ID '{emp_id}' updated successfully!")
+        else:
+            print(f"\nEmployee with ID '{emp_id}' was updated but could not be saved to '{self.filename}'!")
         input("\nPress Enter to continue...")
     
     def delete_employee(self) -> None:
@@ -397,16 +697,20 @@ class EmployeeManager:
         employee = self._employees[emp_id]
         
         print(f"\nAre you sure you want to delete this employee?")
-        print(f"  Name: {employee['Name']}")
-        print(f"  Position: {employee['Position']}")
-        print(f"  Email: {employee['Email']}")
+        print(f"  Name: {employee.Name}")
+        print(f"  Position: {employee.Position}")
+        print(f"  Email: {employee.Email}")
         
         confirm = input("\nType 'YES' to confirm deletion: ").strip().upper()
         
         if confirm == 'YES':
             del self._employees[emp_id]
-            self._save_to_csv()
-            print(f"\nEmployee with ID '{emp_id}' deleted successfully!")
+            self._unindex_email(employee.Email)
+            self._queue_save()
+            if self.flush():
+                print(f"\nEmployee with ID '{emp_id}' deleted successfully!")
+            else:
+                print(f"\nEmployee with ID '{emp_id}' was deleted but could not be saved to '{self.filename}'!")
         else:
             print("\nDeletion cancelled.")
         
@@ -432,15 +736,114 @@ class EmployeeManager:
             print("\n" + "-"*40)
             print("EMPLOYEE FOUND:")
             print("-"*40)
-            print(f"  ID:       {employee['ID']}")
-            print(f"  Name:     {employee['Name']}")
-            print(f"  Position: {employee['Position']}")
-            print(f"  Salary:   ${employee['Salary']:,.2f}")
-            print(f"  Email:    {employee['Email']}")
+            print(f"  ID:       {employee.ID}")
+            print(f"  Name:     {employee.Name}")
+            print(f"  Position: {employee.Position}")
+            print(f"  Salary:   ${employee.Salary:,.2f}")
+            print(f"  Email:    {employee.Email}")
             print("-"*40)
         
         input("\nPress Enter to continue...")
     
+    def salary_statistics(self) -> None:
+        """Display aggregate salary statistics for all employees."""
+        print("\n" + "="*50)
+        print("SALARY STATISTICS")
+        print("="*50)
+        
+        if not self._employees:
+            print("\nNo employees in the system. Please add employees first.")
+            input("\nPress Enter to continue...")
+            return
+        
+        mean, std, lowest, highest = salary_stats(self._salary_column())
+        
+        print(f"\n  Employees:      {len(self._employees)}")
+        print(f"  Average Salary: ${mean:,.2f}")
+        print(f"  Std Deviation:  ${std:,.2f}")
+        print(f"  Lowest Salary:  ${lowest:,.2f}")
+        print(f"  Highest Salary: ${highest:,.2f}")
+        
+        input("\nPress Enter to continue...")
+    
+    # ==================== Bulk Operations ====================
+    
+    def import_employees(self) -> None:
+        """Import employees from a CSV file chosen by the user."""
+        print("\n" + "="*50)
+        print("IMPORT EMPLOYEES FROM CSV")
+        print("="*50)
+        
+        path = input("Enter path of CSV file to import: ").strip()
+        if not path:
+            print("\nImport cancelled.")
+            input("\nPress Enter to continue...")
+            return
+        
+        imported, errors = self.bulk_import(path)
+        
+        for error in errors:
+            print(f"  Skipped - {error}")
+        print(f"\n{imported} employee(s) imported, {len(errors)} problem(s) reported.")
+        input("\nPress Enter to continue...")
+    
+    def bulk_import(self, path: str) -> Tuple[int, List[str]]:
+        """
+        Import employees from an external CSV file without interactive prompts.
+        Invalid or duplicate rows are skipped and reported; the CSV is saved once at the end.
+        """
+        imported = 0
+        errors: List[str] = []
+        
+        try:
+            with open(path, 'r', newline='') as file:
+                reader = csv.reader(file)
+                header = next(reader, None)
+                if not header:
+                    return 0, errors
+                
+                id_i, name_i, pos_i, salary_i, email_i = self._column_positions(header)
+                
+                for row in reader:
+                    if not row:
+                        continue
+                    
+                    line = reader.line_num
+                    if len(row) < len(header):
+                        errors.append(f"Line {line}: Missing columns")
+                        continue
+                    
+                    emp_id = row[id_i].strip()
+                    name = row[name_i].strip()
+                    position = row[pos_i].strip()
+                    email = row[email_i].strip()
+                    
+                    is_valid, error = validate_employee_id(emp_id, self._employees)
+                    if is_valid:
+                        is_valid, error = validate_required_field(name, "Name")
+                    if is_valid:
+                        is_valid, error = validate_required_field(position, "Position")
+                    if is_valid:
+                        is_valid, salary, error = validate_salary(row[salary_i].strip())
+                    if is_valid:
+                        is_valid, error = validate_unique_email(email, self._email_index)
+                    
+                    if not is_valid:
+                        errors.append(f"Line {line}: {error}")
+                        continue
+                    
+                    self._employees[emp_id] = Employee(emp_id, name, position, salary, email)
+                    self._index_email(email)
+                    imported += 1
+        except Exception as e:
+            errors.append(f"Error reading '{path}': {e}")
+        
+        if imported:
+            self._queue_save()
+            if not self.flush():
+                errors.append(f"Error saving data to '{self.filename}'")
+        return imported, errors
+    
     # ==================== Main Run Method ====================
     
     def run(self) -> None:
@@ -455,10 +858,12 @@ class EmployeeManager:
             print("  3. Update Employee")
             print("  4. Delete Employee")
             print("  5. Search Employee")
-            print("  6. Exit")
+            print("  6. Salary Statistics")
+            print("  7. Import Employees from CSV")
+            print("  8. Exit")
             print("\n" + "-"*60)
             
-            choice = input("Enter your choice (1-6): ").strip()
+            choice = input("Enter your choice (1-8): ").strip()
             
             if choice == '1':
                 self.add_employee()
@@ -471,16 +876,21 @@ class EmployeeManager:
             elif choice == '5':
                 self.search_employee()
             elif choice == '6':
+                self.salary_statistics()
+            elif choice == '7':
+                self.import_employees()
+            elif choice == '8':
                 print("\n" + "="*60)
                 print("  Thank you for using Employee Management System!")
                 print("  Goodbye!, With Nour Regards")
                 print("="*60)
+                self.close()
                 break
             else:
-                print("\nInvalid choice! Please enter a number between 1 and 6.")
+                print("\nInvalid choice! Please enter a number between 1 and 8.")
                 input("Press Enter to continue...")
 
 
 if __name__ == "__main__":
-    manager = EmployeeManager()
-    manager.run()
\ No newline at end of file
+    with EmployeeManager() as manager:
+        manager.run()
\ No newline at end of file
@@ -11,8 +11,8 @@ def main():
     Main function to start the Employee Management System.
     """
   
-    manager = EmployeeManager()
-    manager.run()
+    with EmployeeManager() as manager:
+        manager.run()
 
 
 if __name__ == "__main__":